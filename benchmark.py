@@ -0,0 +1,391 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 헤드리스 실행을 위해 GUI 없는 matplotlib 백엔드 사용
+os.environ.setdefault("MPLBACKEND", "Agg")
+import matplotlib.pyplot as plt
+
+# 한글 폰트가 없는 환경에서 반복되는 글리프 경고 숨김
+warnings.filterwarnings("ignore", message="Glyph .* missing from")
+
+# 기본 설정
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app2.py")
+DATA_DIR = "data"
+RESULTS_FILE = f"{DATA_DIR}/rank_results.csv"
+HISTORY_FILE = f"{DATA_DIR}/rank_history.csv"
+CONFIG_FILE = "search_config.json"
+REPORT_FILE = "benchmark_report.json"
+
+# 기본 데이터 크기 (추적 업체 수 x 이력 일수)
+DEFAULT_SIZES = ["100x30", "1000x365", "3000x730"]
+
+# 재실행 제한 시간 기본값 (초): 기본 + 업체 수(막대 그래프) + 이력 행 수에 비례
+TIMEOUT_BASE = 60
+TIMEOUT_PER_PAIR = 0.1
+TIMEOUT_PER_HISTORY_ROW = 0.00002
+
+# 순위 탭의 위젯 라벨 (app2.py와 동일해야 함)
+KEYWORD_LABEL = "검색어 선택"
+SHOP_LABEL = "업체 선택"
+
+
+def parse_size(size):
+    """'업체수x일수' 형식의 문자열을 (업체 수, 일수)로 변환"""
+    try:
+        n_pairs, n_days = (int(part) for part in size.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 크기 형식: {size} (예: 1000x365)")
+    if n_pairs < 1 or n_days < 1:
+        raise argparse.ArgumentTypeError(f"크기는 1 이상이어야 합니다: {size}")
+    return n_pairs, n_days
+
+
+def positive_int(value):
+    """1 이상의 정수만 허용하는 argparse 타입"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def default_timeout(n_pairs, n_days):
+    """데이터 크기에 비례하는 재실행 제한 시간(초)"""
+    return TIMEOUT_BASE + TIMEOUT_PER_PAIR * n_pairs + TIMEOUT_PER_HISTORY_ROW * n_pairs * n_days
+
+
+def generate_dataset(out_dir, n_pairs, n_days, n_keywords=None, found_ratio=0.8, seed=0):
+    """크롤러와 같은 형식의 합성 rank_results.csv / rank_history.csv 생성"""
+    rng = np.random.default_rng(seed)
+    if n_keywords is None:
+        n_keywords = max(1, n_pairs // 20)
+    n_keywords = min(n_keywords, n_pairs)
+
+    # 검색어-업체 쌍 (검색어마다 여러 업체)
+    pair_ids = np.arange(n_pairs)
+    keywords = np.array([f"합성 검색어 {k:04d}" for k in range(n_keywords)])[pair_ids % n_keywords]
+    shops = np.array([f"합성 업체 {p:05d}" for p in pair_ids])
+
+    # 이력 데이터: 날짜마다 모든 쌍을 검색한 것으로 가정
+    dates = pd.date_range(end=datetime.now().date(), periods=n_days).strftime("%Y-%m-%d")
+    found = rng.random(n_pairs * n_days) < found_ratio
+    ranks = rng.integers(1, 301, size=n_pairs * n_days)
+    history_df = pd.DataFrame({
+        "검색어": np.tile(keywords, n_days),
+        "업체명": np.tile(shops, n_days),
+        "순위": np.where(found, ranks.astype(str), "찾을 수 없음"),
+        "찾음": found,
+        "검색날짜": np.repeat(np.asarray(dates), n_pairs),
+    })
+
+    # 최신 결과는 마지막 날짜의 이력과 같음
+    results_df = history_df.iloc[-n_pairs:].drop(columns=["검색날짜"])
+
+    os.makedirs(os.path.join(out_dir, DATA_DIR), exist_ok=True)
+    results_df.to_csv(os.path.join(out_dir, RESULTS_FILE), index=False, encoding='utf-8-sig')
+    history_df.to_csv(os.path.join(out_dir, HISTORY_FILE), index=False, encoding='utf-8-sig')
+
+    config = {"searches": [
+        {"keyword": keyword, "shop_name": shop} for keyword, shop in zip(keywords, shops)
+    ]}
+    with open(os.path.join(out_dir, CONFIG_FILE), 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    return {
+        "n_pairs": n_pairs,
+        "n_days": n_days,
+        "n_keywords": n_keywords,
+        "results_rows": len(results_df),
+        "history_rows": len(history_df),
+        "history_bytes": os.path.getsize(os.path.join(out_dir, HISTORY_FILE)),
+    }
+
+
+# 메모리 측정 함수들
+def reset_peak_rss():
+    """프로세스 최대 RSS 초기화 (Linux 전용, 성공 여부 반환)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB)"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    import resource
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    if sys.platform == "darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+class TimedTab:
+    """st.tabs가 반환한 탭의 with 블록 실행 시간과 생성된 그래프 수 기록"""
+
+    def __init__(self, tab, label, stats):
+        self._tab = tab
+        self._label = label
+        self._stats = stats
+        self._start = None
+        self._figures = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self._figures = len(plt.get_fignums())
+        return self._tab.__enter__()
+
+    def __exit__(self, *exc_info):
+        result = self._tab.__exit__(*exc_info)
+        # 같은 탭이 여러 번 열리는 경우 (app2.py의 탭 1) 합산
+        stats = self._stats.setdefault(self._label, {"latency_s": 0.0, "figures_created": 0})
+        stats["latency_s"] += time.perf_counter() - self._start
+        stats["figures_created"] += len(plt.get_fignums()) - self._figures
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self._tab, name)
+
+
+class AppBenchmark:
+    """AppTest로 app2.py를 헤드리스 실행하고 상호작용별 성능 측정"""
+
+    def __init__(self, data_dir, timeout=60):
+        from streamlit.testing.v1 import AppTest
+
+        self.data_dir = data_dir
+        self.app = AppTest.from_file(APP_FILE, default_timeout=timeout)
+        self.tab_stats = {}
+
+    def _patched_tabs(self, original_tabs):
+        """탭별 시간을 기록하도록 st.tabs 감싸기"""
+        def tabs(labels, *args, **kwargs):
+            return [
+                TimedTab(tab, label, self.tab_stats)
+                for tab, label in zip(original_tabs(labels, *args, **kwargs), labels)
+            ]
+        return tabs
+
+    def run(self):
+        """스크립트 1회 재실행 및 측정 결과 반환"""
+        import streamlit as st
+
+        self.tab_stats = {}
+        original_tabs = st.tabs
+        original_cwd = os.getcwd()
+        st.tabs = self._patched_tabs(original_tabs)
+        os.chdir(self.data_dir)  # app2.py는 상대 경로로 데이터를 읽음
+        reset_peak_rss()
+        try:
+            start = time.perf_counter()
+            self.app.run()
+            latency = time.perf_counter() - start
+        finally:
+            os.chdir(original_cwd)
+            st.tabs = original_tabs
+
+        return {
+            "latency_s": round(latency, 4),
+            "tab_latency_s": {label: round(s["latency_s"], 4) for label, s in self.tab_stats.items()},
+            "figures_created": {label: s["figures_created"] for label, s in self.tab_stats.items()},
+            "figures_total": sum(s["figures_created"] for s in self.tab_stats.values()),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "exceptions": [e.value for e in self.app.exception],
+        }
+
+    def selectbox(self, label):
+        """라벨로 selectbox 위젯 찾기"""
+        for widget in self.app.selectbox:
+            if widget.label == label:
+                return widget
+        return None
+
+    def change_selection(self, label, step):
+        """selectbox 선택을 step만큼 이동 후 재실행 (선택지가 1개 이하면 None)"""
+        widget = self.selectbox(label)
+        if widget is None or len(widget.options) < 2:
+            return None
+        widget.select_index((widget.index + step) % len(widget.options))
+        return self.run()
+
+
+def summarize(name, samples, error=None):
+    """상호작용별 측정 결과 요약"""
+    samples = [s for s in samples if s is not None]
+    if error:
+        return {"interaction": name, "valid": False, "error": error, "samples": samples}
+    if not samples:
+        return {"interaction": name, "skipped": True, "samples": []}
+
+    # 앱에서 예외가 발생한 실행은 성능 비교 대상에서 제외
+    exceptions = sorted({e for s in samples for e in s["exceptions"]})
+    labels = list(samples[0]["tab_latency_s"])
+    return {
+        "interaction": name,
+        "valid": not exceptions,
+        "exceptions": exceptions,
+        "latency_s": {
+            "median": round(float(np.median([s["latency_s"] for s in samples])), 4),
+            "max": max(s["latency_s"] for s in samples),
+        },
+        "tab_latency_s": {
+            label: round(float(np.median([s["tab_latency_s"].get(label, 0.0) for s in samples])), 4)
+            for label in labels
+        },
+        "figures_created": samples[-1]["figures_created"],
+        "figures_total": samples[-1]["figures_total"],
+        "peak_rss_mb": max(s["peak_rss_mb"] for s in samples),
+        "samples": samples,
+    }
+
+
+def benchmark_dataset(data_dir, repeat=3, timeout=60):
+    """하나의 데이터셋에 대해 탭 로드, 검색어 변경, 업체 변경 측정"""
+    # 이전 데이터셋의 그래프가 측정에 섞이지 않도록 정리
+    plt.close("all")
+
+    interactions = []
+    bench = None
+
+    def measure(name, run_once):
+        """repeat회 측정, 제한 시간 초과 등 실행 실패는 오류로 기록"""
+        samples = []
+        try:
+            for _ in range(repeat):
+                samples.append(run_once())
+        except RuntimeError as e:
+            error = "timeout" if "timed out" in str(e) else str(e)
+            interactions.append(summarize(name, samples, error=error))
+            return False
+        interactions.append(summarize(name, samples))
+        return True
+
+    def load():
+        nonlocal bench
+        bench = AppBenchmark(data_dir, timeout=timeout)
+        return bench.run()
+
+    if measure("tab_load", load):
+        measure("keyword_change", lambda: bench.change_selection(KEYWORD_LABEL, 1))
+        measure("shop_change", lambda: bench.change_selection(SHOP_LABEL, 1))
+    else:
+        # 앱 로드에 실패하면 이후 상호작용은 측정할 수 없음
+        for name in ("keyword_change", "shop_change"):
+            interactions.append(summarize(name, [], error="tab_load failed"))
+
+    return interactions
+
+
+def write_report(path, report):
+    """JSON 보고서 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def print_interaction(interaction):
+    """상호작용 측정 결과 콘솔 출력"""
+    name = interaction["interaction"]
+    if interaction.get("error"):
+        print(f"  {name}: 실패 ({interaction['error']})")
+    elif interaction.get("skipped"):
+        print(f"  {name}: 건너뜀 (선택지 부족)")
+    elif not interaction["valid"]:
+        print(f"  경고: {name} 실행 중 앱 예외 발생, 측정값 무효")
+        for exception in interaction["exceptions"]:
+            print(f"    {exception}")
+    else:
+        print(f"  {name}: {interaction['latency_s']['median']}초, "
+              f"최대 RSS {interaction['peak_rss_mb']}MB, 그래프 {interaction['figures_total']}개")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="합성 데이터로 app2.py 대시보드 성능 측정")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[parse_size(s) for s in DEFAULT_SIZES],
+                        help=f"데이터 크기 목록 '업체수x일수' (기본값: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument("--keywords", type=positive_int, default=None, help="검색어 수 (기본값: 업체 수 / 20)")
+    parser.add_argument("--found-ratio", type=float, default=0.8, help="순위를 찾은 비율")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--repeat", type=positive_int, default=3, help="상호작용별 반복 횟수")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help=f"재실행 1회당 제한 시간(초) (기본값: {TIMEOUT_BASE}초 + 데이터 크기에 비례)")
+    parser.add_argument("--data-dir", default=None, help="합성 데이터 저장 위치 (기본값: 임시 디렉토리)")
+    parser.add_argument("--generate-only", action="store_true", help="합성 데이터만 생성하고 종료")
+    parser.add_argument("--output", default=REPORT_FILE, help="JSON 보고서 경로")
+    args = parser.parse_args()
+
+    if args.generate_only and not args.data_dir:
+        parser.error("--generate-only는 --data-dir과 함께 사용해야 합니다.")
+
+    try:
+        import streamlit
+        from streamlit.testing.v1 import AppTest  # noqa: F401
+    except ImportError:
+        if not args.generate_only:
+            parser.error("AppTest를 사용하려면 streamlit 1.28 이상이 필요합니다. (pip install \"streamlit>=1.28\")")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base_dir = args.data_dir or tmp_dir
+        report = {
+            "generated_at": datetime.now().isoformat(),
+            "app": os.path.basename(APP_FILE),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "peak_rss_scope": "interaction" if reset_peak_rss() else "process",
+            "datasets": [],
+        }
+        if not args.generate_only:
+            report["streamlit"] = streamlit.__version__
+            report["pandas"] = pd.__version__
+
+        try:
+            for n_pairs, n_days in args.sizes:
+                data_dir = os.path.join(base_dir, f"{n_pairs}x{n_days}")
+                print(f"합성 데이터 생성 중: 업체 {n_pairs}개 x {n_days}일")
+                dataset = generate_dataset(data_dir, n_pairs, n_days, n_keywords=args.keywords,
+                                           found_ratio=args.found_ratio, seed=args.seed)
+                if args.generate_only:
+                    print(f"합성 데이터가 {data_dir}에 저장되었습니다.")
+                    continue
+
+                timeout = args.timeout or default_timeout(n_pairs, n_days)
+                dataset["timeout_s"] = round(timeout, 1)
+                print(f"성능 측정 중: {n_pairs}x{n_days} (반복 {args.repeat}회, 제한 시간 {timeout:.0f}초)")
+                dataset["interactions"] = benchmark_dataset(data_dir, repeat=args.repeat, timeout=timeout)
+                report["datasets"].append(dataset)
+
+                for interaction in dataset["interactions"]:
+                    print_interaction(interaction)
+
+                # 이후 데이터셋에서 중단되어도 지금까지의 결과는 남도록 매번 저장
+                write_report(args.output, report)
+        finally:
+            if not args.generate_only:
+                write_report(args.output, report)
+                print(f"성능 보고서가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()